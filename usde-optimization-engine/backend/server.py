@@ -1,117 +1,319 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, Response
 from flask_cors import CORS
 import numpy as np
-from scipy.optimize import minimize
+import orjson
 import requests
-import json
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from typing import Any, NamedTuple
+import hashlib
+import os
+import threading
+import time
+
+try:
+    import cvxpy as cp
+except ImportError:
+    cp = None  # Optional: only needed for the constrained solver path
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # Optional: the Sharpe kernel falls back to plain NumPy
+
+
+def _sharpe_ratio(weights: np.ndarray, returns: np.ndarray, cov_matrix: np.ndarray,
+                  risk_free_rate: float) -> float:
+    portfolio_return = (returns * weights).sum()
+    portfolio_volatility = np.sqrt(weights @ cov_matrix @ weights)
+    return (portfolio_return - risk_free_rate) / portfolio_volatility
+
+
+if njit is not None:
+    # nogil lets concurrent Flask threads evaluate the kernel in parallel;
+    # warm it once at import, in float32 to match the runtime arrays, so
+    # the first request hits the already-compiled specialization
+    _sharpe_ratio = njit(cache=True, nogil=True)(_sharpe_ratio)
+    _sharpe_ratio(np.full(4, 0.25, dtype=np.float32),
+                  np.full(4, 0.1, dtype=np.float32),
+                  np.eye(4, dtype=np.float32), 0.03)
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
 
+def ojsonify(obj: Any, status: int = 200) -> Response:
+    """jsonify replacement: orjson serializes NumPy scalars/arrays in C"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+                    mimetype='application/json', status=status)
+
+# Row layout for the mock historical series
+_HISTORICAL_DTYPE = np.dtype([('date', 'U10'), ('apy', 'f4'), ('tvl', 'i8')])
+
+# Risk score based on vault type
+_RISK_SCORES = {'Conservative': 3.2, 'Balanced': 5.8, 'Aggressive': 8.1}
+
+
+class OptimizationResult(NamedTuple):
+    """Raw solver output; dict payloads are materialized at the endpoints"""
+    weights: np.ndarray
+    returns: np.ndarray
+    sharpe_ratio: float
+
+
 class YieldOptimizer:
-    def __init__(self):
+    def __init__(self) -> None:
         self.protocols = {
             'Strata Finance': {'base_apy': 12.5, 'risk_factor': 0.15, 'tvl_capacity': 1000000},
             'Terminal Finance': {'base_apy': 15.8, 'risk_factor': 0.25, 'tvl_capacity': 800000},
             'Ethereal Finance': {'base_apy': 18.2, 'risk_factor': 0.35, 'tvl_capacity': 600000},
             'USDe Staking': {'base_apy': 8.5, 'risk_factor': 0.05, 'tvl_capacity': 2000000}
         }
-    
-    def calculate_sharpe_ratio(self, weights, returns, cov_matrix, risk_free_rate=0.03):
+        # Hoist immutable protocol attributes into contiguous arrays (SoA)
+        # so the hot paths avoid per-request dict iteration
+        # FP32 is plenty for two-significant-figure mock inputs and halves
+        # the per-op memory traffic
+        self._names = list(self.protocols.keys())
+        self._base_returns = np.array(
+            [v['base_apy'] / 100 for v in self.protocols.values()], dtype=np.float32)
+        self._risk_factors = np.array(
+            [v['risk_factor'] for v in self.protocols.values()], dtype=np.float32)
+        rf = self._risk_factors
+        self._cov_matrix = rf[:, None] * rf[None, :] * 0.5
+        np.fill_diagonal(self._cov_matrix, rf * rf)
+        # Risk factors are immutable, so their reductions are too (rounded
+        # so the FP32 arrays still serialize to clean, stable values)
+        self._avg_risk = round(float(rf.mean()), 6)
+        self._max_risk = round(float(rf.max()), 6)
+        self._min_risk = round(float(rf.min()), 6)
+        # Pre-invert so each request is a single matvec Σ⁻¹(μ − r_f·1)
+        try:
+            self._cov_inv = np.linalg.inv(self._cov_matrix)
+        except np.linalg.LinAlgError:
+            self._cov_inv = None
+        # Per-vault solver parameters, resolved once instead of per request
+        self._vault_params = {
+            'Conservative': {'risk_tolerance': 0.1, 'max_allocation': 0.4},
+            'Balanced': {'risk_tolerance': 0.2, 'max_allocation': 0.6},
+            'Aggressive': {'risk_tolerance': 0.4, 'max_allocation': 0.8}
+        }
+        self._cvxpy_problem = None
+        # The CVXPY Problem/Parameter objects are shared mutable state, so
+        # concurrent solves must not race on the parameter values
+        self._cvxpy_lock = threading.Lock()
+        self._historical_cache = None
+        # Per-thread Generators: the legacy global RNG serializes concurrent
+        # requests on its internal lock
+        self._seed_seq = np.random.SeedSequence()
+        self._rng_local = threading.local()
+        # The protocols payload is static: serialize it once at startup
+        self._protocols_json = orjson.dumps({
+            'protocols': [
+                {'name': name, 'base_apy': info['base_apy'],
+                 'risk_factor': info['risk_factor'],
+                 'tvl_capacity': info['tvl_capacity']}
+                for name, info in self.protocols.items()
+            ]
+        })
+        self._protocols_etag = hashlib.md5(self._protocols_json).hexdigest()
+        # Risk metrics are fully derived from immutable state: prebuild one
+        # response buffer (and ETag) per vault type
+        self._risk_metrics_json = {}
+        self._risk_metrics_etag = {}
+        for vault_type, risk_score in _RISK_SCORES.items():
+            payload = orjson.dumps({
+                'risk_score': risk_score,
+                'avg_protocol_risk': self._avg_risk,
+                'max_protocol_risk': self._max_risk,
+                'min_protocol_risk': self._min_risk,
+                'volatility_estimate': f'{self._avg_risk * 100:.1f}%'
+            })
+            self._risk_metrics_json[vault_type] = payload
+            self._risk_metrics_etag[vault_type] = hashlib.md5(payload).hexdigest()
+
+    @property
+    def _rng(self) -> np.random.Generator:
+        rng = getattr(self._rng_local, 'rng', None)
+        if rng is None:
+            rng = np.random.default_rng(self._seed_seq.spawn(1)[0])
+            self._rng_local.rng = rng
+        return rng
+
+    def _get_cvxpy_problem(self, n_assets: int) -> 'cp.Problem':
+        """Build the parametrized CVXPY problem once and reuse it (DPP).
+
+        The problem is compiled on first use; subsequent solves only update
+        Parameter values, so canonicalization is skipped and each solve is a
+        single warm-started cone solve. Used instead of the closed form when
+        extra constraints (sector caps, leverage) are layered on.
+        """
+        if self._cvxpy_problem is None:
+            self._cp_weights = cp.Variable(n_assets)
+            self._cp_returns = cp.Parameter(n_assets)
+            # Cholesky factor of the covariance, pre-scaled by sqrt(gamma)
+            # so the objective stays DPP-compliant
+            self._cp_cov_sqrt = cp.Parameter((n_assets, n_assets))
+            self._cp_max_alloc = cp.Parameter(nonneg=True)
+            objective = cp.Maximize(
+                self._cp_returns @ self._cp_weights
+                - cp.sum_squares(self._cp_cov_sqrt @ self._cp_weights)
+            )
+            constraints = [
+                cp.sum(self._cp_weights) == 1,
+                self._cp_weights >= 0.05,
+                self._cp_weights <= self._cp_max_alloc
+            ]
+            self._cvxpy_problem = cp.Problem(objective, constraints)
+        return self._cvxpy_problem
+
+    def solve_cvxpy(self, current_returns: np.ndarray, cov_matrix: np.ndarray,
+                    risk_tolerance: float, max_allocation: float) -> np.ndarray | None:
+        """Solve the mean-variance problem via the cached CVXPY program"""
+        n_assets = len(current_returns)
+        gamma = 1.0 / (2 * risk_tolerance)
+
+        with self._cvxpy_lock:
+            problem = self._get_cvxpy_problem(n_assets)
+
+            self._cp_returns.value = current_returns
+            # Upper-triangular factor R = Lᵀ so that sum_squares(R @ w)
+            # evaluates wᵀLLᵀw = wᵀΣw
+            self._cp_cov_sqrt.value = np.linalg.cholesky(cov_matrix).T * np.sqrt(gamma)
+            self._cp_max_alloc.value = max_allocation
+
+            problem.solve(solver=cp.CLARABEL, warm_start=True)
+            if problem.status not in ('optimal', 'optimal_inaccurate'):
+                return None
+            return np.asarray(self._cp_weights.value)
+
+    def calculate_sharpe_ratio(self, weights: np.ndarray, returns: np.ndarray,
+                               cov_matrix: np.ndarray, risk_free_rate: float = 0.03) -> float:
         """Calculate Sharpe ratio for portfolio optimization"""
-        portfolio_return = np.sum(returns * weights)
-        portfolio_volatility = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-        return (portfolio_return - risk_free_rate) / portfolio_volatility
-    
-    def optimize_portfolio(self, vault_type='Balanced'):
-        """Optimize portfolio allocation using Modern Portfolio Theory"""
-        protocols = list(self.protocols.keys())
-        n_assets = len(protocols)
-        
-        # Generate mock returns and covariance matrix
-        base_returns = np.array([self.protocols[p]['base_apy']/100 for p in protocols])
-        
+        return _sharpe_ratio(weights, returns, cov_matrix, risk_free_rate)
+
+    def project_weights(self, raw_weights: np.ndarray, min_allocation: float,
+                        max_allocation: float) -> np.ndarray:
+        """Project raw weights onto the simplex with per-asset box constraints"""
+        n_assets = len(raw_weights)
+        total = raw_weights.sum()
+        if total <= 0:
+            return np.full(n_assets, 1 / n_assets, dtype=raw_weights.dtype)
+
+        weights = raw_weights / total
+
+        # Water-filling: clip to bounds and redistribute the shortfall/excess
+        # among unconstrained assets (converges in at most n_assets passes)
+        for _ in range(n_assets):
+            weights = np.clip(weights, min_allocation, max_allocation)
+            excess = 1.0 - weights.sum()
+            # Assets with headroom in the direction we need to move
+            free = weights < max_allocation if excess > 0 else weights > min_allocation
+            if abs(excess) < 1e-12 or not free.any():
+                break
+            weights[free] += excess / free.sum()
+
+        return np.clip(weights, min_allocation, max_allocation)
+
+    def solve_portfolio(self, vault_type: str = 'Balanced',
+                        solver: str = 'analytical') -> OptimizationResult:
+        """Solve the allocation problem and return raw weight/return arrays"""
+        n_assets = len(self._names)
+
         # Add some randomness to simulate market conditions
-        current_returns = base_returns + np.random.normal(0, 0.02, n_assets)
-        
-        # Create covariance matrix based on risk factors
-        risk_factors = np.array([self.protocols[p]['risk_factor'] for p in protocols])
-        cov_matrix = np.outer(risk_factors, risk_factors) * 0.5
-        np.fill_diagonal(cov_matrix, risk_factors ** 2)
-        
-        # Define constraints based on vault type
-        if vault_type == 'Conservative':
-            risk_tolerance = 0.1
-            max_single_allocation = 0.4
-        elif vault_type == 'Balanced':
-            risk_tolerance = 0.2
-            max_single_allocation = 0.6
-        else:  # Aggressive
-            risk_tolerance = 0.4
-            max_single_allocation = 0.8
-        
-        # Objective function (negative Sharpe ratio for minimization)
-        def objective(weights):
-            return -self.calculate_sharpe_ratio(weights, current_returns, cov_matrix)
-        
-        # Constraints
-        constraints = [
-            {'type': 'eq', 'fun': lambda x: np.sum(x) - 1},  # Sum to 1
+        current_returns = self._base_returns + self._rng.normal(0, 0.02, n_assets).astype(np.float32)
+        cov_matrix = self._cov_matrix
+
+        # Constraints for the vault type (unknown types behave as Aggressive)
+        params = self._vault_params.get(vault_type, self._vault_params['Aggressive'])
+        risk_tolerance = params['risk_tolerance']
+        max_single_allocation = params['max_allocation']
+
+        optimal_weights = None
+        if solver == 'cvxpy' and cp is not None:
+            optimal_weights = self.solve_cvxpy(
+                current_returns, cov_matrix, risk_tolerance, max_single_allocation)
+
+        if optimal_weights is None:
+            if self._cov_inv is not None:
+                # Closed-form tangency portfolio: w ∝ Σ⁻¹(μ − r_f·1), then
+                # project onto the box + simplex constraints for the vault type
+                raw_weights = self._cov_inv @ (current_returns - 0.03)
+                optimal_weights = self.project_weights(raw_weights, 0.05, max_single_allocation)
+            else:
+                # Fallback to equal weights if the covariance matrix is singular
+                optimal_weights = np.full(n_assets, 1 / n_assets, dtype=np.float32)
+
+        sharpe_ratio = self.calculate_sharpe_ratio(optimal_weights, current_returns, cov_matrix)
+        return OptimizationResult(optimal_weights, current_returns, float(sharpe_ratio))
+
+    def build_allocations(self, weights: np.ndarray,
+                          returns: np.ndarray) -> list[dict[str, Any]]:
+        """Materialize the allocation dicts for a JSON response"""
+        return [
+            {'name': name, 'value': weight * 100, 'apy': ret * 100}
+            for name, weight, ret in zip(self._names, weights.tolist(), returns.tolist())
         ]
-        
-        # Bounds
-        bounds = [(0.05, max_single_allocation) for _ in range(n_assets)]
-        
-        # Initial guess (equal weights)
-        x0 = np.array([1/n_assets] * n_assets)
-        
-        # Optimize
-        result = minimize(objective, x0, method='SLSQP', bounds=bounds, constraints=constraints)
-        
-        if result.success:
-            optimal_weights = result.x
-        else:
-            # Fallback to equal weights if optimization fails
-            optimal_weights = np.array([1/n_assets] * n_assets)
-        
+
+    def optimize_portfolio(self, vault_type: str = 'Balanced',
+                           solver: str = 'analytical') -> dict[str, Any]:
+        """Optimize portfolio allocation using Modern Portfolio Theory"""
+        result = self.solve_portfolio(vault_type, solver)
+
         # Calculate expected APY
-        portfolio_apy = np.sum(optimal_weights * current_returns * 100)
-        
-        # Format allocation data
-        allocations = []
-        for i, protocol in enumerate(protocols):
-            allocations.append({
-                'name': protocol,
-                'value': optimal_weights[i] * 100,
-                'apy': current_returns[i] * 100
-            })
-        
+        portfolio_apy = float(result.weights @ result.returns) * 100
+
         return {
-            'apy': f'{portfolio_apy:.2f}%',
-            'allocations': allocations,
-            'sharpe_ratio': -result.fun if result.success else 1.5
+            'apy': '%.2f%%' % portfolio_apy,
+            'allocations': self.build_allocations(result.weights, result.returns),
+            'sharpe_ratio': result.sharpe_ratio
         }
-    
-    def generate_historical_data(self, days=30):
-        """Generate mock historical performance data"""
-        historical = []
-        base_date = datetime.now() - timedelta(days=days)
-        
-        for i in range(days):
-            date = base_date + timedelta(days=i)
-            # Simulate APY fluctuation
-            apy = 15.5 + np.sin(i * 0.2) * 3 + random.uniform(-1, 1)
-            # Simulate TVL growth
-            tvl = 1500000 + i * 50000 + random.uniform(-100000, 100000)
-            
-            historical.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'apy': round(apy, 2),
-                'tvl': int(tvl)
-            })
-        
+
+    def optimize_all_vaults(self) -> dict[str, dict[str, Any]]:
+        """Optimize every vault type with one batched closed-form solve"""
+        vault_caps = [(vault_type, params['max_allocation'])
+                      for vault_type, params in self._vault_params.items()]
+        n_vaults = len(vault_caps)
+        n_assets = len(self._names)
+
+        # Stack the noise draws and fuse the three 4x4 solves into a single
+        # matmul against the cached inverse
+        mu = self._base_returns + self._rng.normal(0, 0.02, (n_vaults, n_assets)).astype(np.float32)
+        if self._cov_inv is not None:
+            raw_weights = (mu - 0.03) @ self._cov_inv.T
+        else:
+            raw_weights = np.full((n_vaults, n_assets), 1 / n_assets, dtype=np.float32)
+
+        results = {}
+        for (vault_type, max_allocation), row_raw, returns in zip(vault_caps, raw_weights, mu):
+            weights = self.project_weights(row_raw, 0.05, max_allocation)
+            sharpe_ratio = self.calculate_sharpe_ratio(weights, returns, self._cov_matrix)
+            portfolio_apy = float(weights @ returns) * 100
+            results[vault_type] = {
+                'apy': '%.2f%%' % portfolio_apy,
+                'allocations': self.build_allocations(weights, returns),
+                'sharpe_ratio': float(sharpe_ratio)
+            }
+        return results
+
+    def generate_historical_data(self, days: int = 30) -> list[dict[str, Any]]:
+        """Generate mock historical performance data (cached for 60s)"""
+        now = time.time()
+        if self._historical_cache is not None:
+            cached_at, cached_days, historical = self._historical_cache
+            if cached_days == days and now - cached_at < 60:
+                return historical
+
+        i = np.arange(days)
+        # Fill a contiguous structured array column by column, then
+        # materialize the response dicts in a single pass
+        series = np.empty(days, dtype=_HISTORICAL_DTYPE)
+        series['date'] = (np.datetime64(datetime.now(), 'D') - days + i).astype('U10')
+        series['apy'] = 15.5 + np.sin(i * 0.2) * 3 + self._rng.uniform(-1, 1, days)
+        series['tvl'] = 1500000 + i * 50000 + self._rng.uniform(-100000, 100000, days)
+
+        historical = [
+            {'date': str(row['date']), 'apy': round(float(row['apy']), 2), 'tvl': int(row['tvl'])}
+            for row in series
+        ]
+        self._historical_cache = (now, days, historical)
         return historical
 
 # Initialize optimizer
@@ -129,33 +331,33 @@ def optimize():
         # Add historical data
         result['historical'] = optimizer.generate_historical_data()
         
-        return jsonify(result)
+        return ojsonify(result)
     
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             'error': str(e),
             'apy': 'Error',
             'allocations': [],
             'historical': []
-        }), 500
+        }, status=500)
+
+@app.route('/api/optimize-all', methods=['GET'])
+def optimize_all():
+    """Optimize all vault types in one request for the dashboard"""
+    try:
+        return ojsonify(optimizer.optimize_all_vaults())
+
+    except Exception as e:
+        return ojsonify({'error': str(e)}, status=500)
 
 @app.route('/api/protocols', methods=['GET'])
 def get_protocols():
     """Get available protocols and their info"""
-    try:
-        protocols_info = []
-        for name, info in optimizer.protocols.items():
-            protocols_info.append({
-                'name': name,
-                'base_apy': info['base_apy'],
-                'risk_factor': info['risk_factor'],
-                'tvl_capacity': info['tvl_capacity']
-            })
-        
-        return jsonify({'protocols': protocols_info})
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    etag = optimizer._protocols_etag
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers={'ETag': '"%s"' % etag})
+    return Response(optimizer._protocols_json, mimetype='application/json',
+                    headers={'ETag': '"%s"' % etag})
 
 @app.route('/api/rebalance', methods=['POST'])
 def rebalance():
@@ -166,77 +368,68 @@ def rebalance():
         current_allocations = data.get('current_allocations', [])
         
         # Get new optimal allocation
-        new_result = optimizer.optimize_portfolio(vault_type)
-        
-        # Calculate rebalancing trades needed
-        trades = []
-        for i, allocation in enumerate(new_result['allocations']):
-            current_weight = 0
-            if i < len(current_allocations):
-                current_weight = current_allocations[i].get('value', 0)
-            
-            weight_diff = allocation['value'] - current_weight
-            if abs(weight_diff) > 1:  # Only trade if difference > 1%
-                trades.append({
-                    'protocol': allocation['name'],
-                    'action': 'increase' if weight_diff > 0 else 'decrease',
-                    'amount_percent': abs(weight_diff)
-                })
-        
-        return jsonify({
-            'new_allocations': new_result['allocations'],
+        result = optimizer.solve_portfolio(vault_type)
+        n_assets = len(result.weights)
+
+        # Calculate rebalancing trades as a single vectorized diff
+        current_weights = np.zeros(n_assets)
+        for i, allocation in enumerate(current_allocations[:n_assets]):
+            current_weights[i] = allocation.get('value', 0)
+
+        weight_diffs = result.weights * 100 - current_weights
+        trades = [
+            {
+                'protocol': optimizer._names[i],
+                'action': 'increase' if weight_diffs[i] > 0 else 'decrease',
+                'amount_percent': abs(float(weight_diffs[i]))
+            }
+            # Only trade if difference > 1%
+            for i in np.nonzero(np.abs(weight_diffs) > 1)[0]
+        ]
+
+        expected_apy = float(result.weights @ result.returns) * 100
+        return ojsonify({
+            'new_allocations': optimizer.build_allocations(result.weights, result.returns),
             'trades_needed': trades,
-            'expected_apy': new_result['apy']
+            'expected_apy': '%.2f%%' % expected_apy
         })
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, status=500)
 
 @app.route('/api/risk-metrics', methods=['GET'])
 def get_risk_metrics():
     """Get risk metrics for the portfolio"""
-    try:
-        vault_type = request.args.get('type', 'Balanced')
-        
-        # Calculate risk metrics
-        protocols = list(optimizer.protocols.keys())
-        risk_factors = [optimizer.protocols[p]['risk_factor'] for p in protocols]
-        
-        avg_risk = np.mean(risk_factors)
-        max_risk = max(risk_factors)
-        min_risk = min(risk_factors)
-        
-        # Risk score based on vault type
-        if vault_type == 'Conservative':
-            risk_score = 3.2
-        elif vault_type == 'Balanced':
-            risk_score = 5.8
-        else:  # Aggressive
-            risk_score = 8.1
-        
-        return jsonify({
-            'risk_score': risk_score,
-            'avg_protocol_risk': avg_risk,
-            'max_protocol_risk': max_risk,  
-            'min_protocol_risk': min_risk,
-            'volatility_estimate': f'{avg_risk * 100:.1f}%'
-        })
-    
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    vault_type = request.args.get('type', 'Balanced')
+    if vault_type not in _RISK_SCORES:
+        vault_type = 'Aggressive'
+
+    etag = optimizer._risk_metrics_etag[vault_type]
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers={'ETag': '"%s"' % etag})
+    return Response(optimizer._risk_metrics_json[vault_type],
+                    mimetype='application/json', headers={'ETag': '"%s"' % etag})
+
+# Only the timestamp varies between health checks; prebuild the rest
+_HEALTH_PREFIX = b'{"status": "healthy", "timestamp": "'
+_HEALTH_SUFFIX = ('", "protocols_available": %d}' % len(optimizer.protocols)).encode()
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'protocols_available': len(optimizer.protocols)
-    })
+    timestamp = time.strftime('%Y-%m-%dT%H:%M:%S').encode()
+    return Response(b''.join((_HEALTH_PREFIX, timestamp, _HEALTH_SUFFIX)),
+                    mimetype='application/json')
 
 if __name__ == '__main__':
     print("🚀 USDe Yield Optimization Engine Backend Starting...")
     print("📊 Available protocols:", list(optimizer.protocols.keys()))
     print("🌐 Server running on http://localhost:5000")
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
+
+    if os.environ.get('FLASK_ENV') == 'development':
+        # Debugger + reloader only when explicitly asked for: both add
+        # per-request overhead (traceback capture, file-stat polling)
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=8)